@@ -16,7 +16,6 @@
 #############################################
 
 import csv
-import os
 import sys
 from collections import defaultdict
 
@@ -39,11 +38,6 @@ def parse_csv_data(csv_file):
     """Parse airodump-ng CSV output and extract channel data"""
     networks = []
     
-    if not os.path.exists(csv_file):
-        print(f"{RED}[ERROR]{NC} Scan data file not found: {csv_file}")
-        print(f"{YELLOW}[INFO]{NC} Run channel_scan.sh first to generate data.")
-        sys.exit(1)
-    
     try:
         with open(csv_file, 'r', encoding='utf-8', errors='ignore') as f:
             content = f.read()
@@ -102,6 +96,10 @@ def parse_csv_data(csv_file):
                 except (ValueError, IndexError):
                     continue
                     
+    except FileNotFoundError:
+        print(f"{RED}[ERROR]{NC} Scan data file not found: {csv_file}")
+        print(f"{YELLOW}[INFO]{NC} Run channel_scan.sh first to generate data.")
+        sys.exit(1)
     except Exception as e:
         print(f"{RED}[ERROR]{NC} Error reading CSV file: {e}")
         sys.exit(1)
@@ -18,33 +18,60 @@
 import json
 import os
 import subprocess
+import sys
 import time
-from datetime import datetime
 
 class SimplifiedOGMMonitor:
-    def __init__(self):
+    def __init__(self, debug=False):
+        self.debug = debug
         self.status_file = "/home/natak/mesh/ogm_monitor/node_status.json"
         self.local_mac = self.get_local_mac()
+        self.last_nodes = None
+        self.batctl = None
+        self.batctl_lines = []
         print(f"OGM Monitor starting (local MAC: {self.local_mac})")
         print("Press Ctrl+C to exit")
     
     def get_local_mac(self):
         """Get local MAC from wlan1 interface"""
         try:
-            result = subprocess.run(['cat', '/sys/class/net/wlan1/address'], 
-                                  capture_output=True, text=True)
-            return result.stdout.strip() if result.returncode == 0 else None
+            with open('/sys/class/net/wlan1/address', 'r') as f:
+                return f.read().strip()
         except:
             return None
     
+    def start_batctl(self):
+        """Spawn batctl once in watch mode instead of re-running it every tick"""
+        self.batctl = subprocess.Popen(['sudo', 'stdbuf', '-oL', 'batctl', 'o', '-w', '1'],
+                                       stdout=subprocess.PIPE,
+                                       universal_newlines=True, bufsize=1)
+        self.batctl_lines = []
+    
+    def read_batctl_dump(self):
+        """Block until batctl has printed one complete originator table"""
+        if self.batctl is None or self.batctl.poll() is not None:
+            self.start_batctl()
+        
+        while True:
+            line = self.batctl.stdout.readline()
+            if not line:
+                self.batctl.wait()
+                self.batctl = None
+                raise RuntimeError("batctl watch process exited")
+            
+            # Each dump starts with the B.A.T.M.A.N. banner, so the next
+            # banner marks the previous dump as complete
+            if 'B.A.T.M.A.N.' in line and self.batctl_lines:
+                dump, self.batctl_lines = self.batctl_lines, [line]
+                return dump
+            self.batctl_lines.append(line)
+    
     def get_batman_status(self):
         """Parse batctl o output"""
         try:
-            output = subprocess.check_output(['sudo', 'batctl', 'o'], 
-                                           universal_newlines=True)
             nodes = {}
             
-            for line in output.split('\n'):
+            for line in self.read_batctl_dump():
                 if ' * ' in line:
                     parts = line.strip().split()
                     mac = parts[1]
@@ -72,30 +99,45 @@ class SimplifiedOGMMonitor:
             return nodes
         except Exception as e:
             print(f"Error reading batman status: {e}")
+            # Don't respawn batctl in a tight loop if it keeps failing
+            time.sleep(1)
             return {}
     
     def write_status(self, nodes):
         """Write node status to JSON file"""
+        # Nothing changed since the last tick, leave the file alone
+        if nodes == self.last_nodes:
+            return
+        
         try:
             os.makedirs(os.path.dirname(self.status_file), exist_ok=True)
             
+            # One clock read per tick for both the file and the log line
+            now = time.time()
             status = {
-                "timestamp": int(time.time()),
+                "timestamp": int(now),
                 "nodes": nodes
             }
             
+            # Encode up front so the file gets a single write() call
+            payload = json.dumps(status, separators=(',', ':'))
+            
             # Write atomically
             temp_file = self.status_file + '.tmp'
             with open(temp_file, 'w') as f:
-                json.dump(status, f, indent=2)
+                f.write(payload)
             os.rename(temp_file, self.status_file)
+            self.last_nodes = nodes
             
             # Print status
-            current_time = datetime.now().strftime('%H:%M:%S')
+            current_time = time.strftime('%H:%M:%S', time.localtime(now))
             print(f"[{current_time}] Found {len(nodes)} nodes")
-            for mac, info in nodes.items():
-                print(f"  {mac}: last_seen={info['last_seen']:.1f}s, "
-                      f"throughput={info['throughput']:.1f}, nexthop={info['nexthop']}")
+            
+            # Per-node lines every tick flood the journal, only show them when asked
+            if self.debug:
+                for mac, info in nodes.items():
+                    print(f"  {mac}: last_seen={info['last_seen']:.1f}s, "
+                          f"throughput={info['throughput']:.1f}, nexthop={info['nexthop']}")
                       
         except Exception as e:
             print(f"Error writing status: {e}")
@@ -103,13 +145,16 @@ class SimplifiedOGMMonitor:
     def run(self):
         """Main monitoring loop"""
         try:
+            # batctl -w paces the loop, a new dump arrives every second
             while True:
                 nodes = self.get_batman_status()
                 self.write_status(nodes)
-                time.sleep(1)
         except KeyboardInterrupt:
             print("\nExiting...")
+        finally:
+            if self.batctl is not None:
+                self.batctl.terminate()
 
 if __name__ == "__main__":
-    monitor = SimplifiedOGMMonitor()
+    monitor = SimplifiedOGMMonitor(debug='--debug' in sys.argv)
     monitor.run()
@@ -1,4 +1,4 @@
-from flask import Flask, render_template, Response, jsonify, request
+from flask import Flask, render_template, jsonify, request
 import socket
 import subprocess
 import json
@@ -20,6 +20,7 @@ WIFI_CHANNELS = {
 
 # Configuration
 NODE_TIMEOUT = 30  # Seconds - nodes not seen within this time will be greyed out
+NON_OVERLAPPING_CHANNELS = frozenset({1, 6, 11})  # 2.4 GHz channels recommended for the mesh
 
 # Channel scanning state
 scan_state = {
@@ -33,20 +34,34 @@ scan_state = {
 }
 scan_lock = threading.Lock()
 
+# wlan1 MAC, read once on first successful lookup
+cached_local_mac = None
+
 def get_local_mac():
     """Get local MAC from wlan1 interface"""
-    try:
-        result = subprocess.run(['cat', '/sys/class/net/wlan1/address'], 
-                              capture_output=True, text=True)
-        return result.stdout.strip() if result.returncode == 0 else "unknown"
-    except:
-        return "unknown"
+    global cached_local_mac
+    
+    if cached_local_mac is None:
+        try:
+            with open('/sys/class/net/wlan1/address', 'r') as f:
+                cached_local_mac = f.read().strip()
+        except:
+            return "unknown"
+    return cached_local_mac
+
+# Parsed node_status.json, keyed on the file's mtime so it is only re-read on change
+NODE_STATUS_FILE = '/home/natak/mesh/ogm_monitor/node_status.json'
+node_status_cache = {'mtime': None, 'nodes': {}}
 
 def read_node_status():
     try:
-        with open('/home/natak/mesh/ogm_monitor/node_status.json', 'r') as f:
-            data = json.load(f)
-            return data.get('nodes', {})
+        mtime = os.stat(NODE_STATUS_FILE).st_mtime_ns
+        if mtime != node_status_cache['mtime']:
+            with open(NODE_STATUS_FILE, 'r') as f:
+                data = json.load(f)
+            node_status_cache['nodes'] = data.get('nodes', {})
+            node_status_cache['mtime'] = mtime
+        return node_status_cache['nodes']
     except Exception as e:
         print(f"Error reading node_status.json: {e}")
         return {}
@@ -95,9 +110,7 @@ def parse_scan_csv(csv_file):
     """Parse airodump-ng CSV output and extract channel data"""
     networks = []
     
-    if not os.path.exists(csv_file):
-        return networks
-    
+    # A missing file falls through to the except below
     try:
         with open(csv_file, 'r', encoding='utf-8', errors='ignore') as f:
             content = f.read()
@@ -218,10 +231,13 @@ def run_channel_scan(duration):
         csv_file = os.path.join(scan_dir, 'scan_output-01.csv')
         
         # Remove old scan files
-        import glob
-        old_files = glob.glob(os.path.join(scan_dir, 'scan_output*.csv'))
-        if old_files:
-            subprocess.run(['rm', '-f'] + old_files, capture_output=True)
+        with os.scandir(scan_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('scan_output') and entry.name.endswith('.csv'):
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
         
         # Stop mesh services
         subprocess.run(['sudo', 'systemctl', 'stop', 'mesh-startup.service'], 
@@ -536,11 +552,10 @@ def get_channel_scan_results():
             return jsonify({'error': 'No scan results available'}), 400
         
         # Find best channels (non-overlapping: 1, 6, 11)
-        non_overlapping = [1, 6, 11]
         best_channels = []
         
         for result in results:
-            if result['channel'] in non_overlapping:
+            if result['channel'] in NON_OVERLAPPING_CHANNELS:
                 best_channels.append({
                     'channel': result['channel'],
                     'score': result['score'],